@@ -99,9 +99,13 @@ tf.summary.scalar("Reward_mean", mean_reward_)
 
 write_op = tf.summary.merge_all()
 
+# One-hot lookup tables, built once instead of on every step
+one_hot_states = np.eye(state_size)
+one_hot_actions = np.eye(action_size)
+
 allRewards = []
 total_rewards = 0
-maximumRewardRecorded = 0
+maximumRewardRecorded = -np.inf
 episode = 0
 episode_states, episode_actions, episode_rewards = [],[],[]
 
@@ -114,7 +118,7 @@ with tf.Session() as sess:
 
         # Launch the game
         state = env.reset()
-        state = np.eye(16)[state : state + 1]
+        state = one_hot_states[state : state + 1]
         
         #env.render()
            
@@ -131,14 +135,13 @@ with tf.Session() as sess:
 
             # Perform a
             new_state, reward, done, info = env.step(action)
-            new_state = np.eye(16)[new_state : new_state + 1]
+            new_state = one_hot_states[new_state : new_state + 1]
             # Store s, a, r
             episode_states.append(state)
                         
             # For actions because we output only one (the index) we need 2 (1 is for the action taken)
             # We need [0., 1.] (if we take right) not just the index
-            action_ = np.zeros(action_size)
-            action_[action] = 1
+            action_ = one_hot_actions[action]
             
             episode_actions.append(action_)
             
@@ -149,13 +152,14 @@ with tf.Session() as sess:
                 
                 allRewards.append(episode_rewards_sum)
                 
-                total_rewards = np.sum(allRewards)
+                # Running totals instead of re-reducing allRewards every episode
+                total_rewards += episode_rewards_sum
                 
                 # Mean reward
                 mean_reward = np.divide(total_rewards, episode+1)
                 
                 
-                maximumRewardRecorded = np.amax(allRewards)
+                maximumRewardRecorded = max(maximumRewardRecorded, episode_rewards_sum)
                 
                 print("==========================================")
                 print("Episode: ", episode)
@@ -9,6 +9,9 @@ State = namedtuple('State', ['y', 'x'])
 # encapsulates a transition to state and its probability
 Transition = namedtuple('Transition', ['state', 'prob', 'reward'])  # transition to state with probability prob
 
+# array counterpart of Transition, used by GridWorld.transition_table
+TRANSITION_DTYPE = np.dtype([('y', np.int64), ('x', np.int64), ('prob', np.float64), ('reward', np.float64)])
+
 
 class GridWorld:
     """ Cliffwalker. """
@@ -21,6 +24,9 @@ class GridWorld:
     FALL_REWARD = -40
     ACTION_NAMES = {ACTION_LEFT: "Left", ACTION_RIGHT: "Right", ACTION_UP: "Up", ACTION_DOWN: "Down"}
 
+    # attributes rebuilt by _build_tables(), not pickled
+    _DERIVED = ('_transitions', '_cum_probs', 'transition_table')
+
     def __init__(self, height, width, random_action_p=0.1, risky_p_loss=0.15):
 
         self.height, self.width = height, width
@@ -35,15 +41,55 @@ class GridWorld:
 
         self.cliff_states = set()
         if height != 1:
-            for x in range(width):
-                for y in range(height):
-                    s = State(y, x)
-                    p_cliff = 0.1 * (y / height)**2 * bool(x > 1 and y > 0 and x < width-2 and y < height-1)
-                    if s == self.initial_state or s in self.goal_states:
-                        continue
-
-                    if np.random.random() < p_cliff:
-                        self.cliff_states.add(s)
+            # indexed [x, y] so that flattening follows the original column-by-column draw order
+            x, y = np.mgrid[0:width, 0:height]
+            p_cliff = 0.1 * (y / height)**2 * ((x > 1) & (y > 0) & (x < width-2) & (y < height-1))
+
+            candidates = np.ones((width, height), dtype=bool)
+            for s in {self.initial_state} | self.goal_states:
+                candidates[s.x, s.y] = False
+
+            # one draw per candidate cell, same stream as a per-cell np.random.random()
+            cliffs = np.random.random(np.count_nonzero(candidates)) < p_cliff[candidates]
+            self.cliff_states = {State(int(y_), int(x_)) for x_, y_ in zip(x[candidates][cliffs],
+                                                                          y[candidates][cliffs])}
+
+        # the layout is fixed from here on, so build the transition tables once
+        self._build_tables()
+
+    def __getstate__(self):
+        # the transition tables are derived from the layout; rebuild them on load instead of pickling them
+        state = self.__dict__.copy()
+        for name in self._DERIVED:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        # also restores worlds pickled before the tables existed
+        self.__dict__.update(state)
+        self._build_tables()
+
+    def _build_tables(self):
+        """ fills the transition tables served by transitions(), sample_transition() and transition_table """
+        height, width = self.height, self.width
+        self._transitions = {State(y, x): self._build_transitions(State(y, x))
+                             for y in range(height) for x in range(width)}
+
+        # the same table as one preallocated structured array indexed [y, x, a, i], for vectorized sweeps;
+        # unused slots have prob 0 and point back at the state itself
+        nb_actions = len(self.ACTIONS)
+        self.transition_table = np.zeros((height, width, nb_actions, nb_actions), dtype=TRANSITION_DTYPE)
+        self.transition_table['y'] = np.arange(height)[:, None, None, None]
+        self.transition_table['x'] = np.arange(width)[None, :, None, None]
+        for s, transitions in self._transitions.items():
+            for a, trans in zip(self.ACTIONS, transitions):
+                for i, t in enumerate(trans):
+                    self.transition_table[s.y, s.x, a, i] = (t.state.y, t.state.x, t.prob, t.reward)
+
+        # normalised CDF of every (state, action) transition list, indexed [y][x][a], used by sample_transition;
+        # zero-probability padding leaves the CDF flat, and sample_transition never reads past the real entries
+        cum_probs = np.cumsum(self.transition_table['prob'], axis=-1)
+        self._cum_probs = (cum_probs / cum_probs[..., -1:]).tolist()
 
     def states(self):
         """ iterator over all possible states """
@@ -71,6 +117,10 @@ class GridWorld:
         returns a list of Transitions from the state s for each action, only non zero probabilities are given
         serves the lists for all actions at once
         """
+        return self._transitions[s]
+
+    def _build_transitions(self, s):
+        """ computes transitions(s), used to fill the table in __init__ """
         if s in self.goal_states:
             return [[Transition(state=s, prob=1.0, reward=0)] for a in self.ACTIONS]
 
@@ -102,8 +152,12 @@ class GridWorld:
     def sample_transition(self, s, a):
         """ Sample a single transition, duh. """
         trans = self.transitions(s)[a]
-        state_probs = [tran.prob for tran in trans]
-        return trans[np.random.choice(len(trans), p=state_probs)]
+        # inverse-CDF draw over at most 4 entries; same draws as np.random.choice(p=...)
+        u = np.random.random()
+        for tran, c in zip(trans, self._cum_probs[s.y][s.x][a]):
+            if u < c:
+                return tran
+        return trans[-1]
 
 
 
@@ -131,13 +131,13 @@ def value_update(world, Q, P):
     :param P: (M, N): indices of actions to be selected
     :return: (A, M, N): new Q-values
     """
-    Q_ = np.array(Q)
-    for s in world.states():
-        for a, action_transitions in zip(world.ACTIONS, world.transitions(s)):
-            t_p = np.array([t.prob for t in action_transitions])
+    T = world.transition_table  # (M, N, A, K)
+    t_q = T['reward'] + gamma * Q[P[T['y'], T['x']], T['y'], T['x']]
+    Q_ = np.sum(T['prob'] * t_q, axis=-1).transpose(2, 0, 1)
 
-            t_q = [t.reward + gamma * Q[P[t.state.y, t.state.x], t.state.y, t.state.x] for t in action_transitions]
-            Q_[a, s.y, s.x] = np.dot(t_p, t_q)
+    # cliff states are not part of world.states() and keep their old values
+    for s in world.cliff_states:
+        Q_[:, s.y, s.x] = Q[:, s.y, s.x]
 
     return Q_
 
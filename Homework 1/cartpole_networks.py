@@ -14,9 +14,11 @@ class Generator(nn.Generator):
         """
         self.sess_ = sess
         with tf.variable_scope('gen'):
-            self.input_state_ = tf.placeholder(tf.float32, shape=[None, 16], name='input_state')
+            #states are fed as uint8 (as stored in the replay buffer) and cast in-graph
+            self.input_state_ = tf.placeholder(tf.uint8, shape=[None, 16], name='input_state')
             self.input_seed_ = tf.placeholder(tf.float32, shape=[None, 1], name='input_seed')
-            self.concat = tf.concat([self.input_state_, self.input_seed_], 1, name='concat')
+            self.state = tf.cast(self.input_state_, tf.float32, name='state')
+            self.concat = tf.concat([self.state, self.input_seed_], 1, name='concat')
             self.hidden = tf.layers.dense(self.concat, 8, activation=tf.nn.relu, name='hidden')
             self.output_ = tf.layers.dense(self.hidden, 4, name='output')
         self.sess.run(tf.global_variables_initializer())
@@ -88,11 +90,12 @@ class Discriminator(nn.Discriminator):
         """
         self.sess_ = sess
         with tf.variable_scope('dis'):
-            self.input_state_ = tf.placeholder(tf.float32, shape=[None, 16], name='input_state')
+            self.input_state_ = tf.placeholder(tf.uint8, shape=[None, 16], name='input_state')
             self.input_reward_ = tf.placeholder(tf.float32, shape=[None], name='input_reward')
             self.input_action_ = tf.placeholder(tf.float32, shape=[None, 1], name='input_action')
             self.input_reward_exp = tf.expand_dims(self.input_reward_, axis=-1, name='input_reward_expanded')
-            self.concat = tf.concat([self.input_state_, self.input_reward_exp, self.input_action_], axis=1, name='concat')
+            self.state = tf.cast(self.input_state_, tf.float32, name='state')
+            self.concat = tf.concat([self.state, self.input_reward_exp, self.input_action_], axis=1, name='concat')
             self.hidden = tf.layers.dense(self.concat, 8, activation=tf.nn.relu, name='hidden')
             self.output_ = tf.layers.dense(self.hidden, 1, activation=tf.sigmoid, name='output')
         self.sess.run(tf.global_variables_initializer())
@@ -180,11 +183,12 @@ class Discriminator_copy(nn.Discriminator_copy):
 
         #reuse the variables
         with tf.variable_scope('dis', reuse=tf.AUTO_REUSE):
-            self.input_state_ = tf.placeholder(tf.float32, shape=[None, 16], name='input_state')
+            self.input_state_ = tf.placeholder(tf.uint8, shape=[None, 16], name='input_state')
             self.input_reward_ = new_rew_input
             self.input_action_ = tf.placeholder(tf.float32, shape=[None, 1], name='input_action')
             self.input_reward_exp = tf.expand_dims(self.input_reward_, axis=-1, name='input_reward_expanded')
-            self.concat = tf.concat([self.input_state_, self.input_reward_exp, self.input_action_], axis=1, name='concat_copy')
+            self.state = tf.cast(self.input_state_, tf.float32, name='state_copy')
+            self.concat = tf.concat([self.state, self.input_reward_exp, self.input_action_], axis=1, name='concat_copy')
             self.hidden_ker = tf.get_variable('hidden/kernel')
             self.hidden_bias = tf.get_variable('hidden/bias')
             self.output_ker = tf.get_variable('output/kernel')
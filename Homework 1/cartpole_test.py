@@ -1,7 +1,9 @@
 import tensorflow as tf
+from tensorflow.contrib.compiler import jit
 import train_gan_q_learning as train
 import cartpole_networks as networks
 import gym
+import multiprocessing
 
 from gym.envs.registration import register
 register(
@@ -12,24 +14,39 @@ register(
     reward_threshold=0.78, # optimum = .8196
 )
 
-def main():
-    sess = tf.Session()
-    gen = networks.Generator(sess)
-    dis = networks.Discriminator(sess)
-    dis_copy = networks.Discriminator_copy
+def main(num_cpu=None, device=None):
+    if num_cpu is None:
+        num_cpu = multiprocessing.cpu_count()
+    #pin the whole graph to one device; falls back to the CPU when there is no GPU
+    if device is None:
+        device = tf.test.gpu_device_name() or '/cpu:0'
+    #the graph is many small independent ops, so favour inter-op threads
+    config = tf.ConfigProto(intra_op_parallelism_threads=max(1, num_cpu // 2),
+                            inter_op_parallelism_threads=num_cpu,
+                            allow_soft_placement=True,
+                            log_device_placement=False)
+    sess = tf.Session(config=config)
 
     #env = gym.make('CartPole-v0')
     #env = gym.make('FrozenLake-v0')
     env = gym.make('FrozenLakeNotSlippery-v0') #supposibly removes slippery surfaces
-    train.learn(env,
-                sess,
-                100, #1000
-                10000, 
-                0.99, 
-                dis,
-                dis_copy,
-                gen,
-                n_gen=5,
-                log_dir='C:/CSCLOGS/')
+    #mark every op built here for XLA so the small elementwise ops of the GAN
+    #losses get fused; unlike the session-level global_jit_level this also
+    #applies on the CPU
+    with tf.device(device), jit.experimental_jit_scope():
+        gen = networks.Generator(sess)
+        dis = networks.Discriminator(sess)
+        dis_copy = networks.Discriminator_copy
+
+        train.learn(env,
+                    sess,
+                    100, #1000
+                    10000, 
+                    0.99, 
+                    dis,
+                    dis_copy,
+                    gen,
+                    n_gen=5,
+                    log_dir='C:/CSCLOGS/')
 
 if __name__ == '__main__' : main()
@@ -60,6 +60,7 @@ def learn(env,
             writer output directory if not None
     """
     z_shape = gen.input_seed.get_shape().as_list()[1:]
+    batch_z_shape = [batch_size] + z_shape
 
     #Assertion statements (make sure session remains the same across graphs)
     assert sess == dis.sess
@@ -68,6 +69,10 @@ def learn(env,
     #Reset environment
     last_obs = env.reset()
 
+    #one-hot lookup table for the discrete states; slicing a row out of it
+    #is a view, so the observations don't get rebuilt every step
+    one_hot = np.eye(16, dtype=np.uint8)
+
     #The gradient for loss function
     grad_val_ph = tf.placeholder(tf.float32, shape=dis.input_reward.get_shape())
     grad_dis = dis_copy(dis, grad_val_ph)
@@ -116,23 +121,21 @@ def learn(env,
     #number of episodes to train
     for epi in range(episodes):
         #loop through all the steps
-        rew_agg = 0
         reward_all = 0
         for env_epi in range(env._max_episode_steps):
             gen_seed = np.random.normal(0, 1, size=z_shape)
             #gen_seed = np.eye[state, ]
             action_results = sess.run(gen.output, feed_dict={
                 #gen.input_state : np.array([last_obs]),
-                gen.input_state : np.eye(16)[last_obs: last_obs+1],
-                gen.input_seed : np.array([gen_seed])
+                gen.input_state : one_hot[last_obs: last_obs+1],
+                gen.input_seed : gen_seed[None]
             })[0]
             optimal_action = np.argmax(action_results)
 
             next_obs, reward, done, _ = env.step(optimal_action)
-            rew_agg += reward
             reward_all += reward
             # idx = buffer.store_frame(last_obs)
-            idx = buffer.store_frame(np.eye(16)[last_obs: last_obs+1][0])
+            idx = buffer.store_frame(one_hot[last_obs])
             buffer.store_effect(idx, optimal_action, reward, done)
 
             if done:
@@ -156,30 +159,18 @@ def learn(env,
                     buffer.sample(batch_size)
                 )
                 #print("AFTER THE BUFFER.SAMPLE")
-                batch_z = np.random.normal(0, 1, size=[batch_size] + z_shape)
-                batch_y = []
-                for i in range(batch_size):
-                    if done_batch[i]:
-                        batch_y.append(rew_batch[i])
-                    else:
-                        expected_ar = sess.run(gen.output, feed_dict={
-                            #edit this line
-                            gen.input_state : np.array([obs_batch[i]]),
-                            #gen.input_state : np.eye(16)[last_obs: last_obs+1],
-                            gen.input_seed: np.array([batch_z[i]])
-                        })
-                        future_reward = np.max(expected_ar)
-                        batch_y.append(rew_batch[i] + reward_discount * future_reward)
-                batch_y = np.array(batch_y)
+                batch_z = np.random.normal(0, 1, size=batch_z_shape)
+                #one sess.run for the whole batch instead of one per sample:
+                #the first half scores obs_batch, the second half last_obs
+                gen_max = np.max(sess.run(gen.output, feed_dict={
+                    gen.input_state : np.concatenate([obs_batch,
+                        np.repeat(one_hot[last_obs: last_obs+1], batch_size, axis=0)]),
+                    gen.input_seed : np.concatenate([batch_z, batch_z])
+                }), axis=1)
+                future_reward, last_reward = gen_max[:batch_size], gen_max[batch_size:]
+                batch_y = np.where(done_batch > 0, rew_batch, rew_batch + reward_discount * future_reward)
                 epsilons = np.random.uniform(0, 1, batch_size)
-                predict_x = []
-                for i in range(batch_size):
-                    predict_x.append(epsilons[i] * batch_y[i] + (1 - epsilons[i]) *
-                                     np.max(sess.run(gen.output, feed_dict={
-                                         #gen.input_state : np.array([obs_batch[i]]),
-                                         gen.input_state : np.eye(16)[last_obs: last_obs+1],
-                                         gen.input_seed : np.array([batch_z[i]])})))
-                predict_x = np.array(predict_x)
+                predict_x = epsilons * batch_y + (1 - epsilons) * last_reward
                 act_batch = np.expand_dims(act_batch, -1)
 
                 sess.run(dis_min_op, feed_dict={
@@ -214,7 +205,7 @@ def learn(env,
             #update the generator n_gen times
             for _ in range(n_gen):
                 obs_batch, act_batch, _, _, _ = (buffer.sample(batch_size))
-                batch_z = np.random.normal(0, 1, size=[batch_size] + z_shape)   
+                batch_z = np.random.normal(0, 1, size=batch_z_shape)   
                 act_batch = np.expand_dims(act_batch, -1)
                 sess.run(gen_min_op, feed_dict={
                     gen.input_seed : batch_z,
@@ -55,11 +55,18 @@ class ReplayBuffer(object):
         return batch_size + 1 <= self.num_in_buffer
 
     def _encode_sample(self, idxes):
-        obs_batch      = np.concatenate([self._encode_observation(idx)[None] for idx in idxes], 0)
+        idxes = np.asarray(idxes)
+        if len(self.obs.shape) == 2:
+            # low-dimensional observations need no frame stacking,
+            # so the whole batch is a single fancy-index gather
+            obs_batch      = self.obs[idxes]
+            next_obs_batch = self.obs[idxes + 1]
+        else:
+            obs_batch      = np.concatenate([self._encode_observation(idx)[None] for idx in idxes], 0)
+            next_obs_batch = np.concatenate([self._encode_observation(idx + 1)[None] for idx in idxes], 0)
         act_batch      = self.action[idxes]
         rew_batch      = self.reward[idxes]
-        next_obs_batch = np.concatenate([self._encode_observation(idx + 1)[None] for idx in idxes], 0)
-        done_mask      = np.array([1.0 if self.done[idx] else 0.0 for idx in idxes], dtype=np.float32)
+        done_mask      = self.done[idxes].astype(np.float32)
 
         return obs_batch, act_batch, rew_batch, next_obs_batch, done_mask
 
@@ -94,7 +101,7 @@ class ReplayBuffer(object):
             Array of shape (batch_size,) and dtype np.float32
         """
         assert self.can_sample(batch_size)
-        idxes = sample_n_unique(lambda: random.randint(0, self.num_in_buffer - 2), batch_size)
+        idxes = random.sample(range(self.num_in_buffer - 1), batch_size)
         return self._encode_sample(idxes)
 
     def encode_recent_observation(self):
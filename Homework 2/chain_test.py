@@ -8,7 +8,8 @@ reward_distribution[9] = 1
 chain_env = Chain(10, 5, reward_distribution)
 
 #Initialize table with all zeros
-Q = np.zeros([chain_env.get_observation_space(),chain_env.get_action_space()])
+n_actions = chain_env.get_action_space()
+Q = np.zeros([chain_env.get_observation_space(),n_actions])
 # Set learning parameters
 lr = .8
 y = .95
@@ -22,16 +23,18 @@ for i in range(num_episodes):
     rAll = 0
     d = False
     j = 0
+    #Draw the exploration noise for the whole episode in one call
+    noise = np.random.randn(99, n_actions)*(1./(i+1))
     #The Q-Table learning algorithm
     while j < 99:
-        j+=1
         #Choose an action by greedily (with noise) picking from Q table
-        a = np.argmax(Q[s,:] + np.random.randn(1,chain_env.get_action_space())*(1./(i+1)))
+        a = np.argmax(Q[s,:] + noise[j])
+        j+=1
         #Get new state and reward from environment
         #print("i",i, "a", a, "s", s)#, "s1", s1)
         s1,r,d = chain_env.step(a)
         #Update Q-Table with new knowledge
-        Q[s,a] = Q[s,a] + lr*(r + y*np.max(Q[s1,:]) - Q[s,a])
+        Q[s,a] += lr*(r + y*Q[s1,:].max() - Q[s,a])
         rAll += r
         s = s1
         if d == True:
@@ -86,7 +86,7 @@ if os.path.isdir(MODEL_DIR):
     exprep = pickle.load(open(MEMORY_PATH,"rb"))
     history = [e_length for e_length in train(agent, exprep, env)]
     saver.save(sess, MODEL_PATH)
-    pickle.dump(exprep, open(MEMORY_PATH, "wb"))
+    pickle.dump(exprep, open(MEMORY_PATH, "wb"), pickle.HIGHEST_PROTOCOL)
     print 'saved model'
     # plot
     import matplotlib.pyplot as plt
@@ -104,8 +104,8 @@ else:
   os.makedirs(MODEL_DIR)
   history = [e_length for e_length in train(agent, exprep, env)]
   saver.save(sess, MODEL_PATH)
-  pickle.dump(exprep, open(MEMORY_PATH, "wb"))
-  pickle.dump(agent, open(MODEL_PATH, "wb"))
+  pickle.dump(exprep, open(MEMORY_PATH, "wb"), pickle.HIGHEST_PROTOCOL)
+  pickle.dump(agent, open(MODEL_PATH, "wb"), pickle.HIGHEST_PROTOCOL)
   print 'saved model'
   # plot
   import matplotlib.pyplot as plt
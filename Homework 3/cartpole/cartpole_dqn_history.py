@@ -87,7 +87,7 @@ for e in range(NUM_EPISODES):
       break
   history.append(episode)
 
-pickle.dump(exprep, open(HISTORY_PATH, "wb"))
+pickle.dump(exprep, open(HISTORY_PATH, "wb"), pickle.HIGHEST_PROTOCOL)
 print 'history saved'
 
 